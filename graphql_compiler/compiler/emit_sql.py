@@ -1,5 +1,5 @@
 # Copyright 2018-present Kensho Technologies, LLC.
-"""Transform a SqlNode tree into an executable SQLAlchemy query."""
+"""Transform lowered IR blocks into an executable SQLAlchemy query."""
 from dataclasses import dataclass
 from typing import Dict, Iterator, List, NamedTuple, Optional, Set, Tuple, Union
 
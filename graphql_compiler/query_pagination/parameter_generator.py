@@ -3,8 +3,8 @@ import bisect
 import itertools
 from typing import Any, Iterator, List, cast
 
-from ..compiler.compiler_frontend import ast_to_ir
 from ..compiler.helpers import Location
+from ..cost_estimation.analysis import QueryPlanningAnalysis
 from ..cost_estimation.filter_selectivity_utils import get_integer_interval_for_filters_on_field
 from ..cost_estimation.helpers import is_uuid4_type
 from ..cost_estimation.int_value_conversion import (
@@ -13,7 +13,6 @@ from ..cost_estimation.int_value_conversion import (
     convert_int_to_field_value,
 )
 from ..cost_estimation.interval import Interval, intersect_int_intervals, measure_int_interval
-from ..global_utils import ASTWithParameters
 from ..schema.schema_info import QueryPlanningSchemaInfo
 from .pagination_planning import VertexPartitionPlan
 
@@ -196,9 +195,7 @@ def _compute_parameters_for_non_uuid_field(
 
 
 def generate_parameters_for_vertex_partition(
-    schema_info: QueryPlanningSchemaInfo,
-    query: ASTWithParameters,
-    vertex_partition: VertexPartitionPlan,
+    query_analysis: QueryPlanningAnalysis, vertex_partition: VertexPartitionPlan,
 ) -> Iterator[Any]:
     """Return a generator of parameter values that realize the vertex partition.
 
@@ -208,8 +205,7 @@ def generate_parameters_for_vertex_partition(
     the same results.
 
     Args:
-        schema_info: contains statistics and relevant schema information
-        query: the query for which we are generating parameters
+        query_analysis: the query with any query analysis needed for pagination
         vertex_partition: the pagination plan we are working on
 
     Returns:
@@ -222,11 +218,8 @@ def generate_parameters_for_vertex_partition(
         raise AssertionError("Invalid number of splits {}".format(vertex_partition))
 
     # Find the FilterInfos on the pagination field
-    query_metadata = ast_to_ir(
-        schema_info.schema,
-        query.query_ast,
-        type_equivalence_hints=schema_info.type_equivalence_hints,
-    ).query_metadata_table
+    schema_info = query_analysis.schema_info
+    query_metadata = query_analysis.metadata_table
     query_location = Location(vertex_partition.query_path)
     vertex_type = query_metadata.get_location_info(query_location).type.name
     filter_infos = query_metadata.get_filter_infos(query_location)
@@ -236,7 +229,11 @@ def generate_parameters_for_vertex_partition(
 
     # Get the value interval currently imposed by existing filters
     integer_interval = get_integer_interval_for_filters_on_field(
-        schema_info, filters_on_field, vertex_type, pagination_field, query.parameters
+        schema_info,
+        filters_on_field,
+        vertex_type,
+        pagination_field,
+        query_analysis.ast_with_parameters.parameters,
     )
     field_value_interval = _convert_int_interval_to_field_value_interval(
         schema_info, vertex_type, pagination_field, integer_interval
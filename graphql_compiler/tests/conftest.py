@@ -4,6 +4,7 @@ from funcy import retry
 import pytest
 import six
 
+from ..schema_generation.graphql_schema import get_graphql_schema_from_schema_graph
 from .test_data_tools.data_tool import (
     generate_neo4j_integration_data,
     generate_orient_integration_data,
@@ -17,6 +18,7 @@ from .test_data_tools.neo4j_graph import get_test_neo4j_graph
 from .test_data_tools.orientdb_graph import get_test_orientdb_graph
 from .test_data_tools.redisgraph_graph import get_test_redisgraph_graph
 from .test_data_tools.schema import load_schema
+from .test_helpers import generate_schema_graph
 
 
 GRAPH_NAME = "animals"  # Name for integration test database
@@ -33,6 +35,14 @@ def init_snapshot_orientdb_client():
     return _init_orientdb_client(load_schema, generate_orient_snapshot_data)
 
 
+@pytest.fixture(scope="session")
+def init_snapshot_orientdb_schema(init_snapshot_orientdb_client):
+    """Return the schema graph, GraphQL schema and type equivalence hints of the snapshot db."""
+    schema_graph = generate_schema_graph(init_snapshot_orientdb_client)
+    graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
+    return schema_graph, graphql_schema, type_equivalence_hints
+
+
 @pytest.fixture(scope="session")
 def init_integration_orientdb_client():
     """Return a client for an initialized db, with all test data imported."""
@@ -86,6 +96,15 @@ def snapshot_orientdb_client(request, init_snapshot_orientdb_client):
     request.cls.orientdb_client = init_snapshot_orientdb_client
 
 
+@pytest.fixture(scope="class")
+def snapshot_orientdb_schema(request, init_snapshot_orientdb_schema):
+    """Get the schema graph, GraphQL schema and type equivalence hints of the snapshot db."""
+    schema_graph, graphql_schema, type_equivalence_hints = init_snapshot_orientdb_schema
+    request.cls.schema_graph = schema_graph
+    request.cls.graphql_schema = graphql_schema
+    request.cls.type_equivalence_hints = type_equivalence_hints
+
+
 @pytest.fixture(scope="class")
 def integration_orientdb_client(request, init_integration_orientdb_client):
     """Get a client for an initialized db, with all test data imported."""
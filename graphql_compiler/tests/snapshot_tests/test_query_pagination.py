@@ -1,14 +1,15 @@
 # Copyright 2019-present Kensho Technologies, LLC.
 import datetime
-from typing import Tuple
+from functools import lru_cache
+from typing import Any, Dict, Optional, Sequence, Tuple
 import unittest
 
-from graphql import print_ast
+from graphql import DocumentNode, print_ast
 import pytest
 
 from .. import test_input_data
 from ...ast_manipulation import safe_parse_graphql
-from ...cost_estimation.analysis import analyze_query_string
+from ...cost_estimation.analysis import QueryPlanningAnalysis, analyze_query_string
 from ...cost_estimation.statistics import LocalStatistics
 from ...exceptions import GraphQLInvalidArgumentError
 from ...global_utils import ASTWithParameters, QueryStringWithParameters
@@ -27,29 +28,82 @@ from ...query_pagination.parameter_generator import (
 )
 from ...query_pagination.query_parameterizer import generate_parameterized_queries
 from ...schema.schema_info import EdgeConstraint, QueryPlanningSchemaInfo, UUIDOrdering
-from ...schema_generation.graphql_schema import get_graphql_schema_from_schema_graph
-from ..test_helpers import compare_graphql, generate_schema_graph, get_function_names_from_module
+from ..test_helpers import compare_graphql, get_function_names_from_module
 from ..test_input_data import CommonTestData
 
 
-# The following TestCase class uses the 'snapshot_orientdb_client' fixture
+# Quantile data shared by many of the tests below. These are tuples so they can be safely shared,
+# and are copied into lists by _make_statistics when building LocalStatistics.
+_LIMBS_QUANTILES_101 = tuple(range(101))
+_LIMBS_QUANTILES_STEP10 = tuple(range(0, 1001, 10))
+_LIMBS_QUANTILES_CONSEC = (0,) * 1000 + tuple(range(101))
+_LIMBS_QUANTILES_REPEATED = tuple(i for i in range(0, 101, 10) for _ in range(10000))
+_EVENT_DATE_QUANTILES = tuple(datetime.datetime(2000 + i, 1, 1) for i in range(101))
+
+# Per-vertex uuid4 field info, shared by all vertices of a test's schema info. The pagination code
+# only ever reads from uuid4_field_info, so sharing one dict across vertices and tests is safe.
+_UUID_LEFT_TO_RIGHT_FIELD_INFO = {"uuid": UUIDOrdering.LeftToRight}
+_UUID_LAST_SIX_BYTES_FIRST_FIELD_INFO = {"uuid": UUIDOrdering.LastSixBytesFirst}
+
+
+@lru_cache(maxsize=64)
+def _cached_parse(query: str) -> DocumentNode:
+    """Parse the given query string, reusing the AST if the same string was parsed before.
+
+    The pagination code under test never mutates the query AST it is given,
+    so it is safe to share one parsed AST across tests.
+    """
+    return safe_parse_graphql(query)
+
+
+@lru_cache(maxsize=32)
+def _make_cached_statistics(
+    class_counts_items: Tuple[Tuple[str, int], ...],
+    field_quantiles_items: Tuple[Tuple[Tuple[str, str], Tuple[Any, ...]], ...],
+) -> LocalStatistics:
+    """Build LocalStatistics from hashable class count and quantile data."""
+    return LocalStatistics(
+        dict(class_counts_items),
+        field_quantiles={key: list(quantiles) for key, quantiles in field_quantiles_items},
+    )
+
+
+def _make_statistics(
+    class_counts: Dict[str, int],
+    *,
+    field_quantiles: Optional[Dict[Tuple[str, str], Sequence[Any]]] = None,
+) -> LocalStatistics:
+    """Return LocalStatistics for the given data, reusing a previously built object if possible.
+
+    LocalStatistics objects are never modified after construction, so tests that use the same
+    class counts and quantiles can safely share one.
+    """
+    if field_quantiles is None:
+        field_quantiles = {}
+    return _make_cached_statistics(
+        tuple(sorted(class_counts.items())),
+        tuple(sorted((key, tuple(quantiles)) for key, quantiles in field_quantiles.items())),
+    )
+
+
+# The following TestCase class uses the 'snapshot_orientdb_schema' fixture
 # which pylint does not recognize as a class member.
 # pylint: disable=no-member
 @pytest.mark.slow
 class QueryPaginationTests(unittest.TestCase):
     """Test the query pagination module."""
 
-    @pytest.mark.usefixtures("snapshot_orientdb_client")
+    @pytest.mark.usefixtures("snapshot_orientdb_schema")
     def test_pagination_planning_basic(self) -> None:
-        schema_graph = generate_schema_graph(self.orientdb_client)  # type: ignore  # from fixture
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
+        schema_graph = self.schema_graph  # type: ignore  # from fixture
+        graphql_schema = self.graphql_schema  # type: ignore  # from fixture
+        type_equivalence_hints = self.type_equivalence_hints  # type: ignore  # from fixture
+        pagination_keys = dict.fromkeys(schema_graph.vertex_class_names, "uuid")
+        uuid4_field_info = dict.fromkeys(
+            schema_graph.vertex_class_names, _UUID_LEFT_TO_RIGHT_FIELD_INFO
+        )
         class_counts = {"Animal": 1000}
-        statistics = LocalStatistics(class_counts)
+        statistics = _make_statistics(class_counts)
         schema_info = QueryPlanningSchemaInfo(
             schema=graphql_schema,
             type_equivalence_hints=type_equivalence_hints,
@@ -76,17 +130,17 @@ class QueryPaginationTests(unittest.TestCase):
         self.assertEqual([w.message for w in expected_advisories], [w.message for w in advisories])
         self.assertEqual(expected_plan, pagination_plan)
 
-    @pytest.mark.usefixtures("snapshot_orientdb_client")
+    @pytest.mark.usefixtures("snapshot_orientdb_schema")
     def test_pagination_planning_invalid_extra_args(self) -> None:
-        schema_graph = generate_schema_graph(self.orientdb_client)  # type: ignore  # from fixture
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
+        schema_graph = self.schema_graph  # type: ignore  # from fixture
+        graphql_schema = self.graphql_schema  # type: ignore  # from fixture
+        type_equivalence_hints = self.type_equivalence_hints  # type: ignore  # from fixture
+        pagination_keys = dict.fromkeys(schema_graph.vertex_class_names, "uuid")
+        uuid4_field_info = dict.fromkeys(
+            schema_graph.vertex_class_names, _UUID_LEFT_TO_RIGHT_FIELD_INFO
+        )
         class_counts = {"Animal": 1000}
-        statistics = LocalStatistics(class_counts)
+        statistics = _make_statistics(class_counts)
         schema_info = QueryPlanningSchemaInfo(
             schema=graphql_schema,
             type_equivalence_hints=type_equivalence_hints,
@@ -110,17 +164,17 @@ class QueryPaginationTests(unittest.TestCase):
             analysis = analyze_query_string(schema_info, query)
             get_pagination_plan(analysis, number_of_pages)
 
-    @pytest.mark.usefixtures("snapshot_orientdb_client")
+    @pytest.mark.usefixtures("snapshot_orientdb_schema")
     def test_pagination_planning_invalid_missing_args(self) -> None:
-        schema_graph = generate_schema_graph(self.orientdb_client)  # type: ignore  # from fixture
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
+        schema_graph = self.schema_graph  # type: ignore  # from fixture
+        graphql_schema = self.graphql_schema  # type: ignore  # from fixture
+        type_equivalence_hints = self.type_equivalence_hints  # type: ignore  # from fixture
+        pagination_keys = dict.fromkeys(schema_graph.vertex_class_names, "uuid")
+        uuid4_field_info = dict.fromkeys(
+            schema_graph.vertex_class_names, _UUID_LEFT_TO_RIGHT_FIELD_INFO
+        )
         class_counts = {"Animal": 1000}
-        statistics = LocalStatistics(class_counts)
+        statistics = _make_statistics(class_counts)
         schema_info = QueryPlanningSchemaInfo(
             schema=graphql_schema,
             type_equivalence_hints=type_equivalence_hints,
@@ -145,17 +199,17 @@ class QueryPaginationTests(unittest.TestCase):
             analysis = analyze_query_string(schema_info, query)
             get_pagination_plan(analysis, number_of_pages)
 
-    @pytest.mark.usefixtures("snapshot_orientdb_client")
+    @pytest.mark.usefixtures("snapshot_orientdb_schema")
     def test_pagination_planning_unique_filter(self) -> None:
-        schema_graph = generate_schema_graph(self.orientdb_client)  # type: ignore  # from fixture
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
+        schema_graph = self.schema_graph  # type: ignore  # from fixture
+        graphql_schema = self.graphql_schema  # type: ignore  # from fixture
+        type_equivalence_hints = self.type_equivalence_hints  # type: ignore  # from fixture
+        pagination_keys = dict.fromkeys(schema_graph.vertex_class_names, "uuid")
+        uuid4_field_info = dict.fromkeys(
+            schema_graph.vertex_class_names, _UUID_LEFT_TO_RIGHT_FIELD_INFO
+        )
         class_counts = {"Animal": 1000}
-        statistics = LocalStatistics(class_counts)
+        statistics = _make_statistics(class_counts)
         schema_info = QueryPlanningSchemaInfo(
             schema=graphql_schema,
             type_equivalence_hints=type_equivalence_hints,
@@ -186,17 +240,17 @@ class QueryPaginationTests(unittest.TestCase):
         self.assertEqual([w.message for w in expected_advisories], [w.message for w in advisories])
         self.assertEqual(expected_plan, pagination_plan)
 
-    @pytest.mark.usefixtures("snapshot_orientdb_client")
+    @pytest.mark.usefixtures("snapshot_orientdb_schema")
     def test_pagination_planning_unique_filter_on_many_to_one(self) -> None:
-        schema_graph = generate_schema_graph(self.orientdb_client)  # type: ignore  # from fixture
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
+        schema_graph = self.schema_graph  # type: ignore  # from fixture
+        graphql_schema = self.graphql_schema  # type: ignore  # from fixture
+        type_equivalence_hints = self.type_equivalence_hints  # type: ignore  # from fixture
+        pagination_keys = dict.fromkeys(schema_graph.vertex_class_names, "uuid")
+        uuid4_field_info = dict.fromkeys(
+            schema_graph.vertex_class_names, _UUID_LEFT_TO_RIGHT_FIELD_INFO
+        )
         class_counts = {"Animal": 1000}
-        statistics = LocalStatistics(class_counts)
+        statistics = _make_statistics(class_counts)
         edge_constraints = {"Animal_ParentOf": EdgeConstraint.AtMostOneSource}
         schema_info = QueryPlanningSchemaInfo(
             schema=graphql_schema,
@@ -234,18 +288,18 @@ class QueryPaginationTests(unittest.TestCase):
         self.assertEqual([w.message for w in expected_advisories], [w.message for w in advisories])
         self.assertEqual(expected_plan, pagination_plan)
 
-    @pytest.mark.usefixtures("snapshot_orientdb_client")
+    @pytest.mark.usefixtures("snapshot_orientdb_schema")
     def test_pagination_planning_on_int(self) -> None:
-        schema_graph = generate_schema_graph(self.orientdb_client)  # type: ignore  # from fixture
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
+        schema_graph = self.schema_graph  # type: ignore  # from fixture
+        graphql_schema = self.graphql_schema  # type: ignore  # from fixture
+        type_equivalence_hints = self.type_equivalence_hints  # type: ignore  # from fixture
+        pagination_keys = dict.fromkeys(schema_graph.vertex_class_names, "uuid")
+        uuid4_field_info = dict.fromkeys(
+            schema_graph.vertex_class_names, _UUID_LEFT_TO_RIGHT_FIELD_INFO
+        )
         pagination_keys["Species"] = "limbs"  # Force pagination on int field
         class_counts = {"Species": 1000}
-        statistics = LocalStatistics(
+        statistics = _make_statistics(
             class_counts, field_quantiles={("Species", "limbs"): list(range(100))}
         )
         schema_info = QueryPlanningSchemaInfo(
@@ -276,18 +330,18 @@ class QueryPaginationTests(unittest.TestCase):
         self.assertEqual([w.message for w in expected_advisories], [w.message for w in advisories])
         self.assertEqual(expected_plan, pagination_plan)
 
-    @pytest.mark.usefixtures("snapshot_orientdb_client")
+    @pytest.mark.usefixtures("snapshot_orientdb_schema")
     def test_pagination_planning_on_int_error(self) -> None:
-        schema_graph = generate_schema_graph(self.orientdb_client)  # type: ignore  # from fixture
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
+        schema_graph = self.schema_graph  # type: ignore  # from fixture
+        graphql_schema = self.graphql_schema  # type: ignore  # from fixture
+        type_equivalence_hints = self.type_equivalence_hints  # type: ignore  # from fixture
+        pagination_keys = dict.fromkeys(schema_graph.vertex_class_names, "uuid")
+        uuid4_field_info = dict.fromkeys(
+            schema_graph.vertex_class_names, _UUID_LEFT_TO_RIGHT_FIELD_INFO
+        )
         pagination_keys["Species"] = "limbs"  # Force pagination on int field
         class_counts = {"Species": 1000}
-        statistics = LocalStatistics(class_counts)
+        statistics = _make_statistics(class_counts)
         schema_info = QueryPlanningSchemaInfo(
             schema=graphql_schema,
             type_equivalence_hints=type_equivalence_hints,
@@ -314,17 +368,16 @@ class QueryPaginationTests(unittest.TestCase):
         self.assertEqual([w.message for w in expected_advisories], [w.message for w in advisories])
         self.assertEqual(expected_plan, pagination_plan)
 
-    # TODO: These tests can be sped up by having an existing test SchemaGraph object.
-    @pytest.mark.usefixtures("snapshot_orientdb_client")
+    @pytest.mark.usefixtures("snapshot_orientdb_schema")
     def test_basic_pagination(self) -> None:
         """Ensure a basic pagination query is handled correctly."""
-        schema_graph = generate_schema_graph(self.orientdb_client)  # type: ignore  # from fixture
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
+        schema_graph = self.schema_graph  # type: ignore  # from fixture
+        graphql_schema = self.graphql_schema  # type: ignore  # from fixture
+        type_equivalence_hints = self.type_equivalence_hints  # type: ignore  # from fixture
+        pagination_keys = dict.fromkeys(schema_graph.vertex_class_names, "uuid")
+        uuid4_field_info = dict.fromkeys(
+            schema_graph.vertex_class_names, _UUID_LEFT_TO_RIGHT_FIELD_INFO
+        )
         query = QueryStringWithParameters(
             """{
             Animal {
@@ -338,7 +391,7 @@ class QueryPaginationTests(unittest.TestCase):
             "Animal": 4,
         }
 
-        statistics = LocalStatistics(count_data)
+        statistics = _make_statistics(count_data)
         schema_info = QueryPlanningSchemaInfo(
             schema=graphql_schema,
             type_equivalence_hints=type_equivalence_hints,
@@ -426,16 +479,16 @@ class QueryPaginationTests(unittest.TestCase):
         ).cardinality_estimate
         self.assertAlmostEqual(1, second_page_cardinality_estimate)
 
-    @pytest.mark.usefixtures("snapshot_orientdb_client")
+    @pytest.mark.usefixtures("snapshot_orientdb_schema")
     def test_basic_pagination_mssql_uuids(self) -> None:
         """Ensure a basic pagination query is handled correctly."""
-        schema_graph = generate_schema_graph(self.orientdb_client)  # type: ignore  # from fixture
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LastSixBytesFirst}
-            for vertex_name in schema_graph.vertex_class_names
-        }
+        schema_graph = self.schema_graph  # type: ignore  # from fixture
+        graphql_schema = self.graphql_schema  # type: ignore  # from fixture
+        type_equivalence_hints = self.type_equivalence_hints  # type: ignore  # from fixture
+        pagination_keys = dict.fromkeys(schema_graph.vertex_class_names, "uuid")
+        uuid4_field_info = dict.fromkeys(
+            schema_graph.vertex_class_names, _UUID_LAST_SIX_BYTES_FIRST_FIELD_INFO
+        )
         query = QueryStringWithParameters(
             """{
             Animal {
@@ -449,7 +502,7 @@ class QueryPaginationTests(unittest.TestCase):
             "Animal": 4,
         }
 
-        statistics = LocalStatistics(count_data)
+        statistics = _make_statistics(count_data)
         schema_info = QueryPlanningSchemaInfo(
             schema=graphql_schema,
             type_equivalence_hints=type_equivalence_hints,
@@ -537,22 +590,19 @@ class QueryPaginationTests(unittest.TestCase):
         ).cardinality_estimate
         self.assertAlmostEqual(1, second_page_cardinality_estimate)
 
-    @pytest.mark.usefixtures("snapshot_orientdb_client")
+    @pytest.mark.usefixtures("snapshot_orientdb_schema")
     def test_pagination_datetime(self):
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
+        schema_graph = self.schema_graph
+        graphql_schema = self.graphql_schema
+        type_equivalence_hints = self.type_equivalence_hints
+        pagination_keys = dict.fromkeys(schema_graph.vertex_class_names, "uuid")
         pagination_keys["Event"] = "event_date"  # Force pagination on datetime field
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
+        uuid4_field_info = dict.fromkeys(
+            schema_graph.vertex_class_names, _UUID_LEFT_TO_RIGHT_FIELD_INFO
+        )
         class_counts = {"Event": 1000}
-        statistics = LocalStatistics(
-            class_counts,
-            field_quantiles={
-                ("Event", "event_date"): [datetime.datetime(2000 + i, 1, 1) for i in range(101)],
-            },
+        statistics = _make_statistics(
+            class_counts, field_quantiles={("Event", "event_date"): _EVENT_DATE_QUANTILES,},
         )
         schema_info = QueryPlanningSchemaInfo(
             schema=graphql_schema,
@@ -640,22 +690,19 @@ class QueryPaginationTests(unittest.TestCase):
         compare_graphql(self, expected_remainder_query.query_string, remainder[0].query_string)
         self.assertEqual(expected_remainder_query.parameters, remainder[0].parameters)
 
-    @pytest.mark.usefixtures("snapshot_orientdb_client")
+    @pytest.mark.usefixtures("snapshot_orientdb_schema")
     def test_pagination_datetime_existing_filter(self):
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
+        schema_graph = self.schema_graph
+        graphql_schema = self.graphql_schema
+        type_equivalence_hints = self.type_equivalence_hints
+        pagination_keys = dict.fromkeys(schema_graph.vertex_class_names, "uuid")
         pagination_keys["Event"] = "event_date"  # Force pagination on datetime field
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
+        uuid4_field_info = dict.fromkeys(
+            schema_graph.vertex_class_names, _UUID_LEFT_TO_RIGHT_FIELD_INFO
+        )
         class_counts = {"Event": 1000}
-        statistics = LocalStatistics(
-            class_counts,
-            field_quantiles={
-                ("Event", "event_date"): [datetime.datetime(2000 + i, 1, 1) for i in range(101)],
-            },
+        statistics = _make_statistics(
+            class_counts, field_quantiles={("Event", "event_date"): _EVENT_DATE_QUANTILES,},
         )
         schema_info = QueryPlanningSchemaInfo(
             schema=graphql_schema,
@@ -710,22 +757,19 @@ class QueryPaginationTests(unittest.TestCase):
         compare_graphql(self, expected_remainder_query.query_string, remainder[0].query_string)
         self.assertEqual(expected_remainder_query.parameters, remainder[0].parameters)
 
-    @pytest.mark.usefixtures("snapshot_orientdb_client")
+    @pytest.mark.usefixtures("snapshot_orientdb_schema")
     def test_pagination_existing_datetime_filter(self):
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
+        schema_graph = self.schema_graph
+        graphql_schema = self.graphql_schema
+        type_equivalence_hints = self.type_equivalence_hints
+        pagination_keys = dict.fromkeys(schema_graph.vertex_class_names, "uuid")
         pagination_keys["Event"] = "event_date"  # Force pagination on datetime field
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
+        uuid4_field_info = dict.fromkeys(
+            schema_graph.vertex_class_names, _UUID_LEFT_TO_RIGHT_FIELD_INFO
+        )
         class_counts = {"Event": 1000}
-        statistics = LocalStatistics(
-            class_counts,
-            field_quantiles={
-                ("Event", "event_date"): [datetime.datetime(2000 + i, 1, 1) for i in range(101)],
-            },
+        statistics = _make_statistics(
+            class_counts, field_quantiles={("Event", "event_date"): _EVENT_DATE_QUANTILES,},
         )
         schema_info = QueryPlanningSchemaInfo(
             schema=graphql_schema,
@@ -783,19 +827,19 @@ class QueryPaginationTests(unittest.TestCase):
         compare_graphql(self, expected_remainder_query.query_string, remainder[0].query_string)
         self.assertEqual(expected_remainder_query.parameters, remainder[0].parameters)
 
-    @pytest.mark.usefixtures("snapshot_orientdb_client")
+    @pytest.mark.usefixtures("snapshot_orientdb_schema")
     def test_parameter_value_generation_int(self):
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
+        schema_graph = self.schema_graph
+        graphql_schema = self.graphql_schema
+        type_equivalence_hints = self.type_equivalence_hints
+        pagination_keys = dict.fromkeys(schema_graph.vertex_class_names, "uuid")
         pagination_keys["Species"] = "limbs"  # Force pagination on int field
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
+        uuid4_field_info = dict.fromkeys(
+            schema_graph.vertex_class_names, _UUID_LEFT_TO_RIGHT_FIELD_INFO
+        )
         class_counts = {"Species": 1000}
-        statistics = LocalStatistics(
-            class_counts, field_quantiles={("Species", "limbs"): [i for i in range(101)],}
+        statistics = _make_statistics(
+            class_counts, field_quantiles={("Species", "limbs"): _LIMBS_QUANTILES_101,}
         )
         schema_info = QueryPlanningSchemaInfo(
             schema=graphql_schema,
@@ -812,27 +856,26 @@ class QueryPaginationTests(unittest.TestCase):
             }
         }"""
         args = {}
-        query_ast = safe_parse_graphql(query)
+        query_ast = _cached_parse(query)
         vertex_partition = VertexPartitionPlan(("Species",), "limbs", 4)
-        generated_parameters = generate_parameters_for_vertex_partition(
-            schema_info, ASTWithParameters(query_ast, args), vertex_partition
-        )
+        analysis = QueryPlanningAnalysis(schema_info, ASTWithParameters(query_ast, args))
+        generated_parameters = generate_parameters_for_vertex_partition(analysis, vertex_partition)
 
         expected_parameters = [25, 50, 75]
         self.assertEqual(expected_parameters, list(generated_parameters))
 
-    @pytest.mark.usefixtures("snapshot_orientdb_client")
+    @pytest.mark.usefixtures("snapshot_orientdb_schema")
     def test_parameter_value_generation_int_few_quantiles(self):
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
+        schema_graph = self.schema_graph
+        graphql_schema = self.graphql_schema
+        type_equivalence_hints = self.type_equivalence_hints
+        pagination_keys = dict.fromkeys(schema_graph.vertex_class_names, "uuid")
         pagination_keys["Species"] = "limbs"  # Force pagination on int field
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
+        uuid4_field_info = dict.fromkeys(
+            schema_graph.vertex_class_names, _UUID_LEFT_TO_RIGHT_FIELD_INFO
+        )
         class_counts = {"Species": 10000000}
-        statistics = LocalStatistics(
+        statistics = _make_statistics(
             class_counts, field_quantiles={("Species", "limbs"): [0, 10, 20, 30,],}
         )
         schema_info = QueryPlanningSchemaInfo(
@@ -850,11 +893,10 @@ class QueryPaginationTests(unittest.TestCase):
             }
         }"""
         args = {}
-        query_ast = safe_parse_graphql(query)
+        query_ast = _cached_parse(query)
         vertex_partition = VertexPartitionPlan(("Species",), "limbs", 3)
-        generated_parameters = generate_parameters_for_vertex_partition(
-            schema_info, ASTWithParameters(query_ast, args), vertex_partition
-        )
+        analysis = QueryPlanningAnalysis(schema_info, ASTWithParameters(query_ast, args))
+        generated_parameters = generate_parameters_for_vertex_partition(analysis, vertex_partition)
 
         expected_parameters = [10, 20]
         self.assertEqual(expected_parameters, list(generated_parameters))
@@ -871,19 +913,19 @@ class QueryPaginationTests(unittest.TestCase):
         self.assertEqual([1, 3, 5], list(_choose_parameter_values([1, 3, 5], 4)))
         self.assertEqual([1, 3, 5], list(_choose_parameter_values([1, 3, 5], 5)))
 
-    @pytest.mark.usefixtures("snapshot_orientdb_client")
+    @pytest.mark.usefixtures("snapshot_orientdb_schema")
     def test_parameter_value_generation_int_existing_filters(self):
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
+        schema_graph = self.schema_graph
+        graphql_schema = self.graphql_schema
+        type_equivalence_hints = self.type_equivalence_hints
+        pagination_keys = dict.fromkeys(schema_graph.vertex_class_names, "uuid")
         pagination_keys["Species"] = "limbs"  # Force pagination on int field
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
+        uuid4_field_info = dict.fromkeys(
+            schema_graph.vertex_class_names, _UUID_LEFT_TO_RIGHT_FIELD_INFO
+        )
         class_counts = {"Species": 1000}
-        statistics = LocalStatistics(
-            class_counts, field_quantiles={("Species", "limbs"): [i for i in range(101)],}
+        statistics = _make_statistics(
+            class_counts, field_quantiles={("Species", "limbs"): _LIMBS_QUANTILES_101,}
         )
         schema_info = QueryPlanningSchemaInfo(
             schema=graphql_schema,
@@ -901,27 +943,26 @@ class QueryPaginationTests(unittest.TestCase):
             }
         }"""
         args = {"limbs_lower": 25}
-        query_ast = safe_parse_graphql(query)
+        query_ast = _cached_parse(query)
         vertex_partition = VertexPartitionPlan(("Species",), "limbs", 3)
-        generated_parameters = generate_parameters_for_vertex_partition(
-            schema_info, ASTWithParameters(query_ast, args), vertex_partition
-        )
+        analysis = QueryPlanningAnalysis(schema_info, ASTWithParameters(query_ast, args))
+        generated_parameters = generate_parameters_for_vertex_partition(analysis, vertex_partition)
 
         expected_parameters = [50, 75]
         self.assertEqual(expected_parameters, list(generated_parameters))
 
-    @pytest.mark.usefixtures("snapshot_orientdb_client")
+    @pytest.mark.usefixtures("snapshot_orientdb_schema")
     def test_parameter_value_generation_int_existing_filter_tiny_page(self):
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
+        schema_graph = self.schema_graph
+        graphql_schema = self.graphql_schema
+        type_equivalence_hints = self.type_equivalence_hints
+        pagination_keys = dict.fromkeys(schema_graph.vertex_class_names, "uuid")
         pagination_keys["Species"] = "limbs"  # Force pagination on int field
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
+        uuid4_field_info = dict.fromkeys(
+            schema_graph.vertex_class_names, _UUID_LEFT_TO_RIGHT_FIELD_INFO
+        )
         class_counts = {"Species": 1000}
-        statistics = LocalStatistics(
+        statistics = _make_statistics(
             class_counts, field_quantiles={("Species", "limbs"): list(range(0, 101, 10))},
         )
         schema_info = QueryPlanningSchemaInfo(
@@ -940,28 +981,27 @@ class QueryPaginationTests(unittest.TestCase):
             }
         }"""
         args = {"limbs_lower": 10}
-        query_ast = safe_parse_graphql(query)
+        query_ast = _cached_parse(query)
         vertex_partition = VertexPartitionPlan(("Species",), "limbs", 10)
-        generated_parameters = generate_parameters_for_vertex_partition(
-            schema_info, ASTWithParameters(query_ast, args), vertex_partition
-        )
+        analysis = QueryPlanningAnalysis(schema_info, ASTWithParameters(query_ast, args))
+        generated_parameters = generate_parameters_for_vertex_partition(analysis, vertex_partition)
 
         first_parameter = next(generated_parameters)
         self.assertTrue(first_parameter > 10)
 
-    @pytest.mark.usefixtures("snapshot_orientdb_client")
+    @pytest.mark.usefixtures("snapshot_orientdb_schema")
     def test_parameter_value_generation_int_existing_filters_2(self):
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
+        schema_graph = self.schema_graph
+        graphql_schema = self.graphql_schema
+        type_equivalence_hints = self.type_equivalence_hints
+        pagination_keys = dict.fromkeys(schema_graph.vertex_class_names, "uuid")
         pagination_keys["Species"] = "limbs"  # Force pagination on int field
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
+        uuid4_field_info = dict.fromkeys(
+            schema_graph.vertex_class_names, _UUID_LEFT_TO_RIGHT_FIELD_INFO
+        )
         class_counts = {"Species": 1000}
-        statistics = LocalStatistics(
-            class_counts, field_quantiles={("Species", "limbs"): [i for i in range(101)],}
+        statistics = _make_statistics(
+            class_counts, field_quantiles={("Species", "limbs"): _LIMBS_QUANTILES_101,}
         )
         schema_info = QueryPlanningSchemaInfo(
             schema=graphql_schema,
@@ -979,28 +1019,27 @@ class QueryPaginationTests(unittest.TestCase):
             }
         }"""
         args = {"limbs_upper": 76}
-        query_ast = safe_parse_graphql(query)
+        query_ast = _cached_parse(query)
         vertex_partition = VertexPartitionPlan(("Species",), "limbs", 3)
-        generated_parameters = generate_parameters_for_vertex_partition(
-            schema_info, ASTWithParameters(query_ast, args), vertex_partition
-        )
+        analysis = QueryPlanningAnalysis(schema_info, ASTWithParameters(query_ast, args))
+        generated_parameters = generate_parameters_for_vertex_partition(analysis, vertex_partition)
 
         expected_parameters = [25, 50]
         self.assertEqual(expected_parameters, list(generated_parameters))
 
-    @pytest.mark.usefixtures("snapshot_orientdb_client")
+    @pytest.mark.usefixtures("snapshot_orientdb_schema")
     def test_parameter_value_generation_inline_fragment(self):
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
+        schema_graph = self.schema_graph
+        graphql_schema = self.graphql_schema
+        type_equivalence_hints = self.type_equivalence_hints
+        pagination_keys = dict.fromkeys(schema_graph.vertex_class_names, "uuid")
         pagination_keys["Species"] = "limbs"  # Force pagination on int field
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
+        uuid4_field_info = dict.fromkeys(
+            schema_graph.vertex_class_names, _UUID_LEFT_TO_RIGHT_FIELD_INFO
+        )
         class_counts = {"Species": 1000}
-        statistics = LocalStatistics(
-            class_counts, field_quantiles={("Species", "limbs"): [i for i in range(101)],}
+        statistics = _make_statistics(
+            class_counts, field_quantiles={("Species", "limbs"): _LIMBS_QUANTILES_101,}
         )
         schema_info = QueryPlanningSchemaInfo(
             schema=graphql_schema,
@@ -1021,28 +1060,27 @@ class QueryPaginationTests(unittest.TestCase):
             }
         }"""
         args = {}
-        query_ast = safe_parse_graphql(query)
+        query_ast = _cached_parse(query)
         vertex_partition = VertexPartitionPlan(("Species", "out_Entity_Related"), "limbs", 4)
-        generated_parameters = generate_parameters_for_vertex_partition(
-            schema_info, ASTWithParameters(query_ast, args), vertex_partition
-        )
+        analysis = QueryPlanningAnalysis(schema_info, ASTWithParameters(query_ast, args))
+        generated_parameters = generate_parameters_for_vertex_partition(analysis, vertex_partition)
 
         expected_parameters = [25, 50, 75]
         self.assertEqual(expected_parameters, list(generated_parameters))
 
-    @pytest.mark.usefixtures("snapshot_orientdb_client")
+    @pytest.mark.usefixtures("snapshot_orientdb_schema")
     def test_parameter_value_generation_with_existing_filters(self):
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
+        schema_graph = self.schema_graph
+        graphql_schema = self.graphql_schema
+        type_equivalence_hints = self.type_equivalence_hints
+        pagination_keys = dict.fromkeys(schema_graph.vertex_class_names, "uuid")
         pagination_keys["Species"] = "limbs"  # Force pagination on int field
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
+        uuid4_field_info = dict.fromkeys(
+            schema_graph.vertex_class_names, _UUID_LEFT_TO_RIGHT_FIELD_INFO
+        )
         class_counts = {"Species": 1000}
-        statistics = LocalStatistics(
-            class_counts, field_quantiles={("Species", "limbs"): list(range(0, 1001, 10))}
+        statistics = _make_statistics(
+            class_counts, field_quantiles={("Species", "limbs"): _LIMBS_QUANTILES_STEP10}
         )
         schema_info = QueryPlanningSchemaInfo(
             schema=graphql_schema,
@@ -1060,32 +1098,28 @@ class QueryPaginationTests(unittest.TestCase):
             }
         }"""
         args = {"num_limbs": 505}
-        query_ast = safe_parse_graphql(query)
+        query_ast = _cached_parse(query)
         vertex_partition = VertexPartitionPlan(("Species",), "limbs", 4)
-        generated_parameters = generate_parameters_for_vertex_partition(
-            schema_info, ASTWithParameters(query_ast, args), vertex_partition
-        )
+        analysis = QueryPlanningAnalysis(schema_info, ASTWithParameters(query_ast, args))
+        generated_parameters = generate_parameters_for_vertex_partition(analysis, vertex_partition)
 
         # XXX document why this is expected, see if bisect_left logic is correct
         expected_parameters = [130, 260, 390]
         self.assertEqual(expected_parameters, list(generated_parameters))
 
-    @pytest.mark.usefixtures("snapshot_orientdb_client")
+    @pytest.mark.usefixtures("snapshot_orientdb_schema")
     def test_parameter_value_generation_datetime(self):
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
+        schema_graph = self.schema_graph
+        graphql_schema = self.graphql_schema
+        type_equivalence_hints = self.type_equivalence_hints
+        pagination_keys = dict.fromkeys(schema_graph.vertex_class_names, "uuid")
         pagination_keys["Event"] = "event_date"  # Force pagination on datetime field
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
+        uuid4_field_info = dict.fromkeys(
+            schema_graph.vertex_class_names, _UUID_LEFT_TO_RIGHT_FIELD_INFO
+        )
         class_counts = {"Event": 1000}
-        statistics = LocalStatistics(
-            class_counts,
-            field_quantiles={
-                ("Event", "event_date"): [datetime.datetime(2000 + i, 1, 1) for i in range(101)],
-            },
+        statistics = _make_statistics(
+            class_counts, field_quantiles={("Event", "event_date"): _EVENT_DATE_QUANTILES,},
         )
         schema_info = QueryPlanningSchemaInfo(
             schema=graphql_schema,
@@ -1102,11 +1136,10 @@ class QueryPaginationTests(unittest.TestCase):
             }
         }"""
         args = {}
-        query_ast = safe_parse_graphql(query)
+        query_ast = _cached_parse(query)
         vertex_partition = VertexPartitionPlan(("Event",), "event_date", 4)
-        generated_parameters = generate_parameters_for_vertex_partition(
-            schema_info, ASTWithParameters(query_ast, args), vertex_partition
-        )
+        analysis = QueryPlanningAnalysis(schema_info, ASTWithParameters(query_ast, args))
+        generated_parameters = generate_parameters_for_vertex_partition(analysis, vertex_partition)
 
         expected_parameters = [
             datetime.datetime(2025, 1, 1, 0, 0),
@@ -1115,17 +1148,17 @@ class QueryPaginationTests(unittest.TestCase):
         ]
         self.assertEqual(expected_parameters, list(generated_parameters))
 
-    @pytest.mark.usefixtures("snapshot_orientdb_client")
+    @pytest.mark.usefixtures("snapshot_orientdb_schema")
     def test_parameter_value_generation_uuid(self):
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
+        schema_graph = self.schema_graph
+        graphql_schema = self.graphql_schema
+        type_equivalence_hints = self.type_equivalence_hints
+        pagination_keys = dict.fromkeys(schema_graph.vertex_class_names, "uuid")
+        uuid4_field_info = dict.fromkeys(
+            schema_graph.vertex_class_names, _UUID_LEFT_TO_RIGHT_FIELD_INFO
+        )
         class_counts = {"Animal": 1000}
-        statistics = LocalStatistics(class_counts)
+        statistics = _make_statistics(class_counts)
         schema_info = QueryPlanningSchemaInfo(
             schema=graphql_schema,
             type_equivalence_hints=type_equivalence_hints,
@@ -1141,11 +1174,10 @@ class QueryPaginationTests(unittest.TestCase):
             }
         }"""
         args = {}
-        query_ast = safe_parse_graphql(query)
+        query_ast = _cached_parse(query)
         vertex_partition = VertexPartitionPlan(("Animal",), "uuid", 4)
-        generated_parameters = generate_parameters_for_vertex_partition(
-            schema_info, ASTWithParameters(query_ast, args), vertex_partition
-        )
+        analysis = QueryPlanningAnalysis(schema_info, ASTWithParameters(query_ast, args))
+        generated_parameters = generate_parameters_for_vertex_partition(analysis, vertex_partition)
 
         expected_parameters = [
             "40000000-0000-0000-0000-000000000000",
@@ -1154,17 +1186,17 @@ class QueryPaginationTests(unittest.TestCase):
         ]
         self.assertEqual(expected_parameters, list(generated_parameters))
 
-    @pytest.mark.usefixtures("snapshot_orientdb_client")
+    @pytest.mark.usefixtures("snapshot_orientdb_schema")
     def test_parameter_value_generation_mssql_uuid(self):
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LastSixBytesFirst}
-            for vertex_name in schema_graph.vertex_class_names
-        }
+        schema_graph = self.schema_graph
+        graphql_schema = self.graphql_schema
+        type_equivalence_hints = self.type_equivalence_hints
+        pagination_keys = dict.fromkeys(schema_graph.vertex_class_names, "uuid")
+        uuid4_field_info = dict.fromkeys(
+            schema_graph.vertex_class_names, _UUID_LAST_SIX_BYTES_FIRST_FIELD_INFO
+        )
         class_counts = {"Animal": 1000}
-        statistics = LocalStatistics(class_counts)
+        statistics = _make_statistics(class_counts)
         schema_info = QueryPlanningSchemaInfo(
             schema=graphql_schema,
             type_equivalence_hints=type_equivalence_hints,
@@ -1180,11 +1212,10 @@ class QueryPaginationTests(unittest.TestCase):
             }
         }"""
         args = {}
-        query_ast = safe_parse_graphql(query)
+        query_ast = _cached_parse(query)
         vertex_partition = VertexPartitionPlan(("Animal",), "uuid", 4)
-        generated_parameters = generate_parameters_for_vertex_partition(
-            schema_info, ASTWithParameters(query_ast, args), vertex_partition
-        )
+        analysis = QueryPlanningAnalysis(schema_info, ASTWithParameters(query_ast, args))
+        generated_parameters = generate_parameters_for_vertex_partition(analysis, vertex_partition)
 
         expected_parameters = [
             "00000000-0000-0000-0000-400000000000",
@@ -1193,17 +1224,17 @@ class QueryPaginationTests(unittest.TestCase):
         ]
         self.assertEqual(expected_parameters, list(generated_parameters))
 
-    @pytest.mark.usefixtures("snapshot_orientdb_client")
+    @pytest.mark.usefixtures("snapshot_orientdb_schema")
     def test_parameter_value_generation_mssql_uuid_with_existing_filter(self):
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LastSixBytesFirst}
-            for vertex_name in schema_graph.vertex_class_names
-        }
+        schema_graph = self.schema_graph
+        graphql_schema = self.graphql_schema
+        type_equivalence_hints = self.type_equivalence_hints
+        pagination_keys = dict.fromkeys(schema_graph.vertex_class_names, "uuid")
+        uuid4_field_info = dict.fromkeys(
+            schema_graph.vertex_class_names, _UUID_LAST_SIX_BYTES_FIRST_FIELD_INFO
+        )
         class_counts = {"Animal": 1000}
-        statistics = LocalStatistics(class_counts)
+        statistics = _make_statistics(class_counts)
         schema_info = QueryPlanningSchemaInfo(
             schema=graphql_schema,
             type_equivalence_hints=type_equivalence_hints,
@@ -1222,11 +1253,10 @@ class QueryPaginationTests(unittest.TestCase):
         args = {
             "uuid_lower": "00000000-0000-0000-0000-800000000000",
         }
-        query_ast = safe_parse_graphql(query)
+        query_ast = _cached_parse(query)
         vertex_partition = VertexPartitionPlan(("Animal",), "uuid", 4)
-        generated_parameters = generate_parameters_for_vertex_partition(
-            schema_info, ASTWithParameters(query_ast, args), vertex_partition
-        )
+        analysis = QueryPlanningAnalysis(schema_info, ASTWithParameters(query_ast, args))
+        generated_parameters = generate_parameters_for_vertex_partition(analysis, vertex_partition)
 
         expected_parameters = [
             "00000000-0000-0000-0000-a00000000000",
@@ -1235,20 +1265,19 @@ class QueryPaginationTests(unittest.TestCase):
         ]
         self.assertEqual(expected_parameters, list(generated_parameters))
 
-    @pytest.mark.usefixtures("snapshot_orientdb_client")
+    @pytest.mark.usefixtures("snapshot_orientdb_schema")
     def test_parameter_value_generation_consecutive(self):
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
+        schema_graph = self.schema_graph
+        graphql_schema = self.graphql_schema
+        type_equivalence_hints = self.type_equivalence_hints
+        pagination_keys = dict.fromkeys(schema_graph.vertex_class_names, "uuid")
         pagination_keys["Species"] = "limbs"  # Force pagination on int field
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
+        uuid4_field_info = dict.fromkeys(
+            schema_graph.vertex_class_names, _UUID_LEFT_TO_RIGHT_FIELD_INFO
+        )
         class_counts = {"Species": 1000}
-        statistics = LocalStatistics(
-            class_counts,
-            field_quantiles={("Species", "limbs"): [0 for i in range(1000)] + list(range(101))},
+        statistics = _make_statistics(
+            class_counts, field_quantiles={("Species", "limbs"): _LIMBS_QUANTILES_CONSEC},
         )
         schema_info = QueryPlanningSchemaInfo(
             schema=graphql_schema,
@@ -1265,30 +1294,28 @@ class QueryPaginationTests(unittest.TestCase):
             }
         }"""
         args = {}
-        query_ast = safe_parse_graphql(query)
+        query_ast = _cached_parse(query)
         vertex_partition = VertexPartitionPlan(("Species",), "limbs", 4)
-        generated_parameters = generate_parameters_for_vertex_partition(
-            schema_info, ASTWithParameters(query_ast, args), vertex_partition
-        )
+        analysis = QueryPlanningAnalysis(schema_info, ASTWithParameters(query_ast, args))
+        generated_parameters = generate_parameters_for_vertex_partition(analysis, vertex_partition)
 
         # Check that there are no duplicates
         list_parameters = list(generated_parameters)
         self.assertEqual(len(list_parameters), len(set(list_parameters)))
 
-    @pytest.mark.usefixtures("snapshot_orientdb_client")
+    @pytest.mark.usefixtures("snapshot_orientdb_schema")
     def test_query_parameterizer(self):
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
+        schema_graph = self.schema_graph
+        graphql_schema = self.graphql_schema
+        type_equivalence_hints = self.type_equivalence_hints
+        pagination_keys = dict.fromkeys(schema_graph.vertex_class_names, "uuid")
         pagination_keys["Species"] = "limbs"  # Force pagination on int field
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
+        uuid4_field_info = dict.fromkeys(
+            schema_graph.vertex_class_names, _UUID_LEFT_TO_RIGHT_FIELD_INFO
+        )
         class_counts = {"Species": 1000}
-        statistics = LocalStatistics(
-            class_counts,
-            field_quantiles={("Species", "limbs"): [0 for i in range(1000)] + list(range(101))},
+        statistics = _make_statistics(
+            class_counts, field_quantiles={("Species", "limbs"): _LIMBS_QUANTILES_CONSEC},
         )
         schema_info = QueryPlanningSchemaInfo(
             schema=graphql_schema,
@@ -1327,20 +1354,19 @@ class QueryPaginationTests(unittest.TestCase):
         compare_graphql(self, expected_next_page, print_ast(next_page.query_ast))
         compare_graphql(self, expected_remainder, print_ast(remainder.query_ast))
 
-    @pytest.mark.usefixtures("snapshot_orientdb_client")
+    @pytest.mark.usefixtures("snapshot_orientdb_schema")
     def test_query_parameterizer_name_conflict(self):
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
+        schema_graph = self.schema_graph
+        graphql_schema = self.graphql_schema
+        type_equivalence_hints = self.type_equivalence_hints
+        pagination_keys = dict.fromkeys(schema_graph.vertex_class_names, "uuid")
         pagination_keys["Species"] = "limbs"  # Force pagination on int field
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
+        uuid4_field_info = dict.fromkeys(
+            schema_graph.vertex_class_names, _UUID_LEFT_TO_RIGHT_FIELD_INFO
+        )
         class_counts = {"Species": 1000}
-        statistics = LocalStatistics(
-            class_counts,
-            field_quantiles={("Species", "limbs"): [0 for i in range(1000)] + list(range(101))},
+        statistics = _make_statistics(
+            class_counts, field_quantiles={("Species", "limbs"): _LIMBS_QUANTILES_CONSEC},
         )
         schema_info = QueryPlanningSchemaInfo(
             schema=graphql_schema,
@@ -1382,20 +1408,19 @@ class QueryPaginationTests(unittest.TestCase):
         compare_graphql(self, expected_next_page, print_ast(next_page.query_ast))
         compare_graphql(self, expected_remainder, print_ast(remainder.query_ast))
 
-    @pytest.mark.usefixtures("snapshot_orientdb_client")
+    @pytest.mark.usefixtures("snapshot_orientdb_schema")
     def test_query_parameterizer_filter_deduplication(self):
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
+        schema_graph = self.schema_graph
+        graphql_schema = self.graphql_schema
+        type_equivalence_hints = self.type_equivalence_hints
+        pagination_keys = dict.fromkeys(schema_graph.vertex_class_names, "uuid")
         pagination_keys["Species"] = "limbs"  # Force pagination on int field
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
+        uuid4_field_info = dict.fromkeys(
+            schema_graph.vertex_class_names, _UUID_LEFT_TO_RIGHT_FIELD_INFO
+        )
         class_counts = {"Species": 1000}
-        statistics = LocalStatistics(
-            class_counts,
-            field_quantiles={("Species", "limbs"): [0 for i in range(1000)] + list(range(101))},
+        statistics = _make_statistics(
+            class_counts, field_quantiles={("Species", "limbs"): _LIMBS_QUANTILES_CONSEC},
         )
         schema_info = QueryPlanningSchemaInfo(
             schema=graphql_schema,
@@ -1436,16 +1461,16 @@ class QueryPaginationTests(unittest.TestCase):
         compare_graphql(self, expected_next_page, print_ast(next_page.query_ast))
         compare_graphql(self, expected_remainder, print_ast(remainder.query_ast))
 
-    @pytest.mark.usefixtures("snapshot_orientdb_client")
+    @pytest.mark.usefixtures("snapshot_orientdb_schema")
     def test_no_pagination(self):
         """Ensure pagination is not done when not needed."""
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
+        schema_graph = self.schema_graph
+        graphql_schema = self.graphql_schema
+        type_equivalence_hints = self.type_equivalence_hints
+        pagination_keys = dict.fromkeys(schema_graph.vertex_class_names, "uuid")
+        uuid4_field_info = dict.fromkeys(
+            schema_graph.vertex_class_names, _UUID_LEFT_TO_RIGHT_FIELD_INFO
+        )
         original_query = QueryStringWithParameters(
             """{
             Animal {
@@ -1459,7 +1484,7 @@ class QueryPaginationTests(unittest.TestCase):
             "Animal": 4,
         }
 
-        statistics = LocalStatistics(count_data)
+        statistics = _make_statistics(count_data)
         schema_info = QueryPlanningSchemaInfo(
             schema=graphql_schema,
             type_equivalence_hints=type_equivalence_hints,
@@ -1478,16 +1503,16 @@ class QueryPaginationTests(unittest.TestCase):
         self.assertEqual(original_query.parameters, first.parameters)
         self.assertEqual(0, len(remainder))
 
-    @pytest.mark.usefixtures("snapshot_orientdb_client")
+    @pytest.mark.usefixtures("snapshot_orientdb_schema")
     def test_impossible_pagination(self):
         """Ensure no unwanted error is raised when pagination is needed but stats are missing."""
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
+        schema_graph = self.schema_graph
+        graphql_schema = self.graphql_schema
+        type_equivalence_hints = self.type_equivalence_hints
         pagination_keys = {}  # No pagination keys, so the planner has no options
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
+        uuid4_field_info = dict.fromkeys(
+            schema_graph.vertex_class_names, _UUID_LEFT_TO_RIGHT_FIELD_INFO
+        )
         original_query = QueryStringWithParameters(
             """{
             Animal {
@@ -1501,7 +1526,7 @@ class QueryPaginationTests(unittest.TestCase):
             "Animal": 100000,
         }
 
-        statistics = LocalStatistics(count_data)
+        statistics = _make_statistics(count_data)
         schema_info = QueryPlanningSchemaInfo(
             schema=graphql_schema,
             type_equivalence_hints=type_equivalence_hints,
@@ -1520,22 +1545,19 @@ class QueryPaginationTests(unittest.TestCase):
         self.assertEqual(original_query.parameters, first.parameters)
         self.assertEqual(0, len(remainder))
 
-    @pytest.mark.usefixtures("snapshot_orientdb_client")
+    @pytest.mark.usefixtures("snapshot_orientdb_schema")
     def test_impossible_pagination_strong_filters_few_repeated_quantiles(self):
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
+        schema_graph = self.schema_graph
+        graphql_schema = self.graphql_schema
+        type_equivalence_hints = self.type_equivalence_hints
+        pagination_keys = dict.fromkeys(schema_graph.vertex_class_names, "uuid")
         pagination_keys["Species"] = "limbs"  # Force pagination on int field
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
+        uuid4_field_info = dict.fromkeys(
+            schema_graph.vertex_class_names, _UUID_LEFT_TO_RIGHT_FIELD_INFO
+        )
         class_counts = {"Species": 1000000000000}
-        statistics = LocalStatistics(
-            class_counts,
-            field_quantiles={
-                ("Species", "limbs"): list(i for i in range(0, 101, 10) for _ in range(10000))
-            },
+        statistics = _make_statistics(
+            class_counts, field_quantiles={("Species", "limbs"): _LIMBS_QUANTILES_REPEATED},
         )
         schema_info = QueryPlanningSchemaInfo(
             schema=graphql_schema,
@@ -1565,22 +1587,19 @@ class QueryPaginationTests(unittest.TestCase):
         self.assertEqual(query.parameters, first.parameters)
         self.assertEqual(0, len(remainder))
 
-    @pytest.mark.usefixtures("snapshot_orientdb_client")
+    @pytest.mark.usefixtures("snapshot_orientdb_schema")
     def test_impossible_pagination_strong_filters_few_quantiles(self):
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
+        schema_graph = self.schema_graph
+        graphql_schema = self.graphql_schema
+        type_equivalence_hints = self.type_equivalence_hints
+        pagination_keys = dict.fromkeys(schema_graph.vertex_class_names, "uuid")
         pagination_keys["Species"] = "limbs"  # Force pagination on int field
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
+        uuid4_field_info = dict.fromkeys(
+            schema_graph.vertex_class_names, _UUID_LEFT_TO_RIGHT_FIELD_INFO
+        )
         class_counts = {"Species": 1000000000000}
-        statistics = LocalStatistics(
-            class_counts,
-            field_quantiles={
-                ("Species", "limbs"): list(i for i in range(0, 101, 10) for _ in range(10000))
-            },
+        statistics = _make_statistics(
+            class_counts, field_quantiles={("Species", "limbs"): _LIMBS_QUANTILES_REPEATED},
         )
         schema_info = QueryPlanningSchemaInfo(
             schema=graphql_schema,
@@ -1610,19 +1629,19 @@ class QueryPaginationTests(unittest.TestCase):
         self.assertEqual(query.parameters, first.parameters)
         self.assertEqual(0, len(remainder))
 
-    @pytest.mark.usefixtures("snapshot_orientdb_client")
+    @pytest.mark.usefixtures("snapshot_orientdb_schema")
     def test_with_compiler_tests(self):
         """Test that pagination doesn't crash on any of the queries from the compiler tests."""
-        schema_graph = generate_schema_graph(self.orientdb_client)
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
-        count_data = {vertex_name: 100 for vertex_name in schema_graph.vertex_class_names}
-        count_data.update({edge_name: 100 for edge_name in schema_graph.edge_class_names})
-        statistics = LocalStatistics(count_data)
+        schema_graph = self.schema_graph
+        graphql_schema = self.graphql_schema
+        type_equivalence_hints = self.type_equivalence_hints
+        pagination_keys = dict.fromkeys(schema_graph.vertex_class_names, "uuid")
+        uuid4_field_info = dict.fromkeys(
+            schema_graph.vertex_class_names, _UUID_LEFT_TO_RIGHT_FIELD_INFO
+        )
+        count_data = dict.fromkeys(schema_graph.vertex_class_names, 100)
+        count_data.update(dict.fromkeys(schema_graph.edge_class_names, 100))
+        statistics = _make_statistics(count_data)
         schema_info = QueryPlanningSchemaInfo(
             schema=graphql_schema,
             type_equivalence_hints=type_equivalence_hints,
@@ -1655,16 +1674,16 @@ class QueryPaginationTests(unittest.TestCase):
                     }
                     paginate_query(schema_info, QueryStringWithParameters(query, args), 10)
 
-    @pytest.mark.usefixtures("snapshot_orientdb_client")
+    @pytest.mark.usefixtures("snapshot_orientdb_schema")
     def test_pagination_missing_vertex_class_count(self) -> None:
         """Ensure a basic pagination query is handled correctly."""
-        schema_graph = generate_schema_graph(self.orientdb_client)  # type: ignore  # from fixture
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
+        schema_graph = self.schema_graph  # type: ignore  # from fixture
+        graphql_schema = self.graphql_schema  # type: ignore  # from fixture
+        type_equivalence_hints = self.type_equivalence_hints  # type: ignore  # from fixture
+        pagination_keys = dict.fromkeys(schema_graph.vertex_class_names, "uuid")
+        uuid4_field_info = dict.fromkeys(
+            schema_graph.vertex_class_names, _UUID_LEFT_TO_RIGHT_FIELD_INFO
+        )
         query = QueryStringWithParameters(
             """{
             Animal {
@@ -1675,7 +1694,7 @@ class QueryPaginationTests(unittest.TestCase):
         )
 
         # No class counts provided
-        statistics = LocalStatistics({})
+        statistics = _make_statistics({})
         schema_info = QueryPlanningSchemaInfo(
             schema=graphql_schema,
             type_equivalence_hints=type_equivalence_hints,
@@ -1689,16 +1708,16 @@ class QueryPaginationTests(unittest.TestCase):
         self.assertTrue(first_page_and_remainder.remainder == tuple())
         self.assertEqual(advisories, (MissingClassCount("Animal"),))
 
-    @pytest.mark.usefixtures("snapshot_orientdb_client")
+    @pytest.mark.usefixtures("snapshot_orientdb_schema")
     def test_pagination_missing_non_root_vertex_class_count(self) -> None:
         """Ensure a basic pagination query is handled correctly."""
-        schema_graph = generate_schema_graph(self.orientdb_client)  # type: ignore  # from fixture
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
+        schema_graph = self.schema_graph  # type: ignore  # from fixture
+        graphql_schema = self.graphql_schema  # type: ignore  # from fixture
+        type_equivalence_hints = self.type_equivalence_hints  # type: ignore  # from fixture
+        pagination_keys = dict.fromkeys(schema_graph.vertex_class_names, "uuid")
+        uuid4_field_info = dict.fromkeys(
+            schema_graph.vertex_class_names, _UUID_LEFT_TO_RIGHT_FIELD_INFO
+        )
         query = QueryStringWithParameters(
             """{
             Animal {
@@ -1716,7 +1735,7 @@ class QueryPaginationTests(unittest.TestCase):
             "Animal_LivesIn": 1000,
         }
 
-        statistics = LocalStatistics(count_data)
+        statistics = _make_statistics(count_data)
         schema_info = QueryPlanningSchemaInfo(
             schema=graphql_schema,
             type_equivalence_hints=type_equivalence_hints,
@@ -1730,16 +1749,16 @@ class QueryPaginationTests(unittest.TestCase):
         self.assertTrue(first_page_and_remainder.remainder == tuple())
         self.assertEqual(advisories, (MissingClassCount("Location"),))
 
-    @pytest.mark.usefixtures("snapshot_orientdb_client")
+    @pytest.mark.usefixtures("snapshot_orientdb_schema")
     def test_pagination_missing_edge_class_count(self) -> None:
         """Ensure a basic pagination query is handled correctly."""
-        schema_graph = generate_schema_graph(self.orientdb_client)  # type: ignore  # from fixture
-        graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(schema_graph)
-        pagination_keys = {vertex_name: "uuid" for vertex_name in schema_graph.vertex_class_names}
-        uuid4_field_info = {
-            vertex_name: {"uuid": UUIDOrdering.LeftToRight}
-            for vertex_name in schema_graph.vertex_class_names
-        }
+        schema_graph = self.schema_graph  # type: ignore  # from fixture
+        graphql_schema = self.graphql_schema  # type: ignore  # from fixture
+        type_equivalence_hints = self.type_equivalence_hints  # type: ignore  # from fixture
+        pagination_keys = dict.fromkeys(schema_graph.vertex_class_names, "uuid")
+        uuid4_field_info = dict.fromkeys(
+            schema_graph.vertex_class_names, _UUID_LEFT_TO_RIGHT_FIELD_INFO
+        )
         query = QueryStringWithParameters(
             """{
             Animal {
@@ -1757,7 +1776,7 @@ class QueryPaginationTests(unittest.TestCase):
             "Location": 10000,
         }
 
-        statistics = LocalStatistics(count_data)
+        statistics = _make_statistics(count_data)
         schema_info = QueryPlanningSchemaInfo(
             schema=graphql_schema,
             type_equivalence_hints=type_equivalence_hints,